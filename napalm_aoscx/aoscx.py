@@ -22,10 +22,17 @@ import telnetlib
 import tempfile
 import uuid
 import inspect
+import json
 import logging
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import methodcaller
+from urllib.parse import quote, unquote
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from netaddr import IPNetwork
 from netaddr.core import AddrFormatError
 from netmiko import FileTransfer, InLineTransfer, ConnectHandler
@@ -53,7 +60,6 @@ import pyaoscx
 from pyaoscx.session import Session
 from pyaoscx.vlan import Vlan
 from pyaoscx.interface import Interface
-from pyaoscx.device import Device
 from pyaoscx.mac import Mac
 from pyaoscx.configuration import Configuration
 from pyaoscx.vrf import Vrf
@@ -63,7 +69,106 @@ from pyaoscx.bgp_router import BgpRouter
 
 from threading import Lock
 
-_device_cli_lock = Lock()
+# orjson is optional, the standard library parser is used when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# NAPALM interface counter name -> AOS-CX interface statistics key
+_COUNTER_MAP = (
+    ('tx_errors', 'tx_errors'),
+    ('rx_errors', 'rx_errors'),
+    ('tx_discards', 'tx_dropped'),
+    ('rx_discards', 'rx_dropped'),
+    ('tx_octets', 'tx_bytes'),
+    ('rx_octets', 'rx_bytes'),
+    ('tx_unicast_packets', 'if_hc_out_unicast_packets'),
+    ('rx_unicast_packets', 'if_hc_in_unicast_packets'),
+    ('tx_multicast_packets', 'if_out_multicast_packets'),
+    ('rx_multicast_packets', 'if_in_multicast_packets'),
+    ('tx_broadcast_packets', 'if_out_broadcast_packets'),
+    ('rx_broadcast_packets', 'if_in_broadcast_packets'),
+)
+
+# Physical port names, e.g. '1/1/1', including breakout ports such as '1/1/49:1'
+_PHYS_RE = re.compile(r'\d+/\d+/\d+(:\d+)?$')
+
+_SLUG_RE = re.compile(r'[^\w]+')
+
+# Prefer Django's slugify when available so slugs match the ones built by the front-end
+try:
+    from django.utils.text import slugify
+except ImportError:
+    def slugify(x):
+        return _SLUG_RE.sub('-', x).strip('-').lower()
+
+
+class _LLDPNeighborsDetail(dict):
+    """
+    Dictionary returned by get_lldp_neighbors_detail. Entries are stored once under the
+    decoded interface name, while the slug ('1-1-1') and display name ('Int 1/1/1') used
+    by front-ends are resolved to the same entries when looked up.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._slugs = None
+
+    # Every mutator drops the lazily built slug table so that it is rebuilt on the next miss
+
+    def __setitem__(self, key, value):
+        self._slugs = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._slugs = None
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        self._slugs = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._slugs = None
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._slugs = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._slugs = None
+        return super().popitem()
+
+    def clear(self):
+        self._slugs = None
+        super().clear()
+
+    def __missing__(self, key):
+        if isinstance(key, str):
+            if key.startswith("Int ") and dict.__contains__(self, key[4:]):
+                return dict.__getitem__(self, key[4:])
+            if self._slugs is None:
+                self._slugs = {slugify(name): name for name in self}
+            if key in self._slugs:
+                return dict.__getitem__(self, self._slugs[key])
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
 
 class AOSCXDriver(NetworkDriver):
     """NAPALM driver for Aruba AOS-CX."""
@@ -88,6 +193,16 @@ class AOSCXDriver(NetworkDriver):
         self.session = None
         self.isAlive = False
         self.candidate_config = ''
+        # Guards CLI operations on this device only, other devices are not serialized
+        self._cli_lock = Lock()
+
+        # Short-lived cache of parsed facts (interfaces, VLANs, subsystems...) so that
+        # several getters called back to back share a single REST fetch of each.
+        # Optional args may come in as strings, e.g. from the napalm CLI
+        self.facts_cache_ttl = float(self.optional_args.get("facts_cache_ttl", 3))
+        if self.facts_cache_ttl < 0:
+            raise ValueError("facts_cache_ttl must be a positive number of seconds or 0")
+        self._facts_cache = {}
 
         self.base_url = "https://{0}/rest/v{1}/".format(self.hostname, self.version)
 
@@ -101,7 +216,16 @@ class AOSCXDriver(NetworkDriver):
         try:
             self.session = Session(self.hostname, self.version)
             self.session.open(self.username, self.password)
+            # Keep the TLS connections to the switch alive and pooled so that the many
+            # GETs issued by the getters do not each pay a new handshake. Idempotent
+            # requests are retried on connection errors, e.g. a pooled socket the switch
+            # closed meanwhile.
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                                  max_retries=Retry(total=3, backoff_factor=0.2))
+            self.session.s.mount("https://", adapter)
+            self.session.s.headers.update({"Connection": "keep-alive"})
             self.isAlive = True
+            self._facts_cache.clear()
             self.session_info = {
                 "s": self.session.s,
                 "url": self.base_url
@@ -115,12 +239,11 @@ class AOSCXDriver(NetworkDriver):
         Implementation of NAPALM method 'close'. Closes the connection to the device and does
         the necessary cleanup.
         """
-        session_info = {
-            "s": self.session.s,
-            "url": self.base_url
-        }
-        Session.logout(**session_info)
+        if not self.isAlive:
+            return
+        Session.logout(**self.session_info)
         self.isAlive = False
+        self._facts_cache.clear()
 
     def is_alive(self):
         """
@@ -144,30 +267,38 @@ class AOSCXDriver(NetworkDriver):
          * serial_number - Serial number of the device
          * interface_list - List of the interfaces of the device
         """
-        
-        switch = Device(self.session)
-        switch.get()
-        switch.get_subsystems()
-        uptime_seconds = int(time.time()) - switch.boot_time
-        interface_list = Interface.get_all(self.session)
+        # System and subsystem attributes are retrieved together in a single GET call
+        target_url = (f"{self.base_url}system?depth=2"
+                      "&attributes=software_info,boot_time,mgmt_intf_status,subsystems")
+        response = self.session.s.get(target_url, verify=self.verify_ssl)
+        if not response.ok:
+            raise CommandErrorException(
+                f"System facts fetch failed: {response.status_code} {response.text}"
+            )
+        system = _json_loads(response.content)
+        subsystems = system['subsystems']
+        mgmt_intf_status = system.get('mgmt_intf_status') or {}
+
+        uptime_seconds = int(time.time()) - system['boot_time']
+        interface_list = self._cached_interface_facts()
         product_info = {}
         keys = ['management_module,1/1', 'chassis,1']
         for key in keys:
-            if (len(switch.subsystems[key]['product_info']['serial_number']) > 0):
-                product_info = switch.subsystems[key]['product_info']
+            if subsystems.get(key, {}).get('product_info', {}).get('serial_number'):
+                product_info = subsystems[key]['product_info']
                 break
             
-        if 'hostname' not in switch.mgmt_intf_status:
+        if 'hostname' not in mgmt_intf_status:
             hostname = "ArubaCX"
         else:
-            hostname = switch.mgmt_intf_status['hostname']
+            hostname = mgmt_intf_status['hostname']
             
-        if 'domain_name' not in switch.mgmt_intf_status:
+        if 'domain_name' not in mgmt_intf_status:
             domain_name = ""
         else:
-            domain_name = switch.mgmt_intf_status['domain_name']
+            domain_name = mgmt_intf_status['domain_name']
             
-        if (domain_name is not None) and (len(domain_name) > 0):
+        if domain_name:
             fqdn = hostname + '.' + domain_name
         else:
             fqdn = hostname
@@ -175,7 +306,7 @@ class AOSCXDriver(NetworkDriver):
         fact_info = {
             'uptime': uptime_seconds,
             'vendor': 'Aruba',
-            'os_version': switch.software_info['build_id'],
+            'os_version': system['software_info']['build_id'],
             'serial_number': product_info['serial_number'],
             'model': product_info['product_name'],
             'hostname': hostname,
@@ -201,35 +332,18 @@ class AOSCXDriver(NetworkDriver):
          * mac_address (string)
         """
         interfaces_return = {}
-        interface_list = Interface.get_facts(self.session)
-        for interface in interface_list:
-            interface_details = interface_list[interface]
-            if 'description' not in interface_details or interface_details['description'] is None:
-                interface_details['description'] = ""
-            if 'max_speed' not in interface_details['hw_intf_info']:
-                speed = 'N/A'
-            else:
-                speed = interface_details['hw_intf_info']['max_speed']
-            if 'mtu' not in interface_details:
-                mtu = 'N/A'
-            else:
-                mtu = interface_details['mtu']
-            if 'mac_addr' not in interface_details['hw_intf_info']:
-                mac_address = 'N/A'
-            else:
-                mac_address = interface_details['hw_intf_info']['mac_addr']
-            interface_dictionary = {
-                interface: {
-                    'is_up': (interface_details['link_state'] == "up"),
-                    'is_enabled': (interface_details['admin_state'] == "up"),
-                    'description': interface_details['description'],
-                    'last_flapped': -1.0,
-                    'speed': speed,
-                    'mtu': mtu,
-                    'mac_address': mac_address
-                }
+        interface_list = self._cached_interface_facts()
+        for interface, interface_details in interface_list.items():
+            hw_intf_info = interface_details.get('hw_intf_info') or {}
+            interfaces_return[interface] = {
+                'is_up': (interface_details['link_state'] == "up"),
+                'is_enabled': (interface_details['admin_state'] == "up"),
+                'description': interface_details.get('description') or "",
+                'last_flapped': -1.0,
+                'speed': hw_intf_info.get('max_speed', 'N/A'),
+                'mtu': interface_details.get('mtu', 'N/A'),
+                'mac_address': hw_intf_info.get('mac_addr', 'N/A')
             }
-            interfaces_return.update(interface_dictionary)
 
         return interfaces_return
 
@@ -255,62 +369,12 @@ class AOSCXDriver(NetworkDriver):
             * rx_broadcast_packets (int)
         """
         interface_stats_dictionary = {}
-        interface_list = Interface.get_facts(self.session)
-        for interface in interface_list:
-            interface_details = interface_list[interface]
-            intf_counter = {
-                'tx_errors': 0,
-                'rx_errors': 0,
-                'tx_discards': 0,
-                'rx_discards': 0,
-                'tx_octets': 0,
-                'rx_octets': 0,
-                'tx_unicast_packets': 0,
-                'rx_unicast_packets': 0,
-                'tx_multicast_packets': 0,
-                'rx_multicast_packets': 0,
-                'tx_broadcast_packets': 0,
-                'rx_broadcast_packets': 0
+        interface_list = self._cached_interface_facts()
+        for interface, interface_details in interface_list.items():
+            statistics = interface_details['statistics']
+            interface_stats_dictionary[interface] = {
+                counter: statistics.get(stat, 0) for counter, stat in _COUNTER_MAP
             }
-            if 'tx_bytes' in interface_details['statistics']:
-                intf_counter['tx_octets'] = interface_details['statistics']['tx_bytes']
-
-            if 'rx_bytes' in interface_details['statistics']:
-                intf_counter['rx_octets'] = interface_details['statistics']['rx_bytes']
-
-            if 'if_hc_out_unicast_packets' in interface_details['statistics']:
-                intf_counter['tx_unicast_packets'] = interface_details['statistics']['if_hc_out_unicast_packets']
-
-            if 'if_hc_in_unicast_packets' in interface_details['statistics']:
-                intf_counter['rx_unicast_packets'] = interface_details['statistics']['if_hc_in_unicast_packets']
-
-            if 'if_out_multicast_packets' in interface_details['statistics']:
-                intf_counter['tx_multicast_packets'] = interface_details['statistics']['if_out_multicast_packets']
-
-            if 'if_in_multicast_packets' in interface_details['statistics']:
-                intf_counter['rx_multicast_packets'] = interface_details['statistics']['if_in_multicast_packets']
-
-            if 'if_out_broadcast_packets' in interface_details['statistics']:
-                intf_counter['tx_broadcast_packets'] = interface_details['statistics']['if_out_broadcast_packets']
-
-            if 'if_in_broadcast_packets' in interface_details['statistics']:
-                intf_counter['rx_broadcast_packets'] = interface_details['statistics']['if_in_broadcast_packets']
-
-            if 'tx_errors' in interface_details['statistics']:
-                intf_counter['tx_errors'] = interface_details['statistics']['tx_errors']
-
-            if 'rx_errors' in interface_details['statistics']:
-                intf_counter['rx_errors'] = interface_details['statistics']['rx_errors']
-
-            if 'tx_dropped' in interface_details['statistics']:
-                intf_counter['tx_discards'] = interface_details['statistics']['tx_dropped']
-
-            if 'rx_dropped' in interface_details['statistics']:
-                intf_counter['rx_discards'] = interface_details['statistics']['rx_dropped']
-
-            interface_stats_dictionary.update({
-                interface: intf_counter
-            })
 
         return interface_stats_dictionary
 
@@ -327,9 +391,7 @@ class AOSCXDriver(NetworkDriver):
         lldp_interfaces_list = LLDPNeighbor.get_facts(self.session)
         
         
-        for interface_uri in lldp_interfaces_list:
-            interface_name = interface_uri
-            interface_details = lldp_interfaces_list[interface_uri]
+        for interface_name, interface_details in lldp_interfaces_list.items():
 
             if interface_name not in lldp_brief_return.keys():
                 lldp_brief_return[interface_name] = []
@@ -350,43 +412,27 @@ class AOSCXDriver(NetworkDriver):
         Implementation of NAPALM method get_lldp_neighbors_detail with URL-decoding,
         slug mapping, display-name key for front-end.
         """
-        import logging
-        # Fetch raw LLDP data
+        # Fetch raw LLDP data, only for the requested interface when one is given
         try:
-            raw_lldp = LLDPNeighbor.get_facts(self.session)
-            logging.debug("LLDPNeighbor.get_facts returned: %s", raw_lldp)
+            if interface:
+                raw_lldp = self._get_interface_lldp_neighbors(interface)
+            else:
+                raw_lldp = LLDPNeighbor.get_facts(self.session)
+            logging.debug("LLDP neighbor facts returned: %s", raw_lldp)
         except Exception as e:
             logging.error("Error fetching LLDP facts: %s", e, exc_info=True)
             return {}
 
-        # URL-decode interface URIs
-        try:
-            from urllib.parse import unquote
-        except ImportError:
-            def unquote(x): return x
-
-        # Prepare slugify for slugs
-        try:
-            from django.utils.text import slugify
-        except ImportError:
-            import re
-            def slugify(x): return re.sub(r'[^\w]+', '-', x).strip('-').lower()
-
         # Determine which raw keys to process based on requested interface
-        decoded_map = {unquote(raw): raw for raw in raw_lldp.keys()}
-        if interface:
-            if interface not in decoded_map:
-                logging.warning("Requested interface %s not found in LLDP facts", interface)
-                return {}
-            raw_keys = [decoded_map[interface]]
-        else:
-            raw_keys = list(raw_lldp.keys())
+        if interface and interface not in raw_lldp:
+            logging.warning("Requested interface %s not found in LLDP facts", interface)
+            return {}
+        raw_keys = list(raw_lldp.keys())
         logging.debug("Raw interface URIs to process: %s", raw_keys)
 
-        lldp_details_return = {}
+        lldp_details_return = _LLDPNeighborsDetail()
         for raw_key in raw_keys:
             decoded_intf = unquote(raw_key)
-            slug_intf = slugify(decoded_intf)
             # Initialize entries list
             entries = []
             interface_details = raw_lldp.get(raw_key, {})
@@ -407,21 +453,35 @@ class AOSCXDriver(NetworkDriver):
                 }
                 entries.append(entry)
 
-            # Assign entries under decoded name and slug
+            # Slug and display name ("Int 1/1/1") lookups are resolved on demand
             lldp_details_return[decoded_intf] = entries
-            lldp_details_return[slug_intf] = entries
-            # *** New: Assign under the display name used as <tr id="…"> in the template
-            display_name = f"Int {decoded_intf}"
-            lldp_details_return[display_name] = entries
-
-            logging.debug(
-                "Assigned LLDP entries for keys '%s', '%s', and display '%s': %s",
-                decoded_intf, slug_intf, display_name, entries
-            )
+            logging.debug("Assigned LLDP entries for '%s': %s", decoded_intf, entries)
 
         logging.debug("Final LLDP details return keys: %s", list(lldp_details_return.keys()))
         return lldp_details_return
 
+    def _get_interface_lldp_neighbors(self, interface):
+        """
+        Perform a GET call to get the LLDP neighbors of a single interface of the switch.
+
+        :param interface: Name of the interface, e.g. '1/1/1'
+        :return: Dictionary keyed by the interface name whose value holds the LLDP neighbors
+            in the same format as LLDPNeighbor.get_facts(), or an empty dictionary if the
+            interface does not exist
+        """
+        target_url = (f"{self.base_url}system/interfaces/{quote(interface, safe='')}"
+                      "/lldp_neighbors?depth=2")
+        response = self.session.s.get(target_url, verify=self.verify_ssl)
+        if response.status_code == 404:
+            return {}
+        if not response.ok:
+            raise CommandErrorException(
+                f"LLDP neighbors fetch failed: {response.status_code} {response.text}"
+            )
+        # An interface without neighbors is still reported, just with nothing under it
+        neighbors = _json_loads(response.content) if response.content else None
+        return {interface: neighbors or {}}
+
     def get_environment(self):
         """
         Implementation of NAPALM method get_environment()
@@ -442,7 +502,9 @@ class AOSCXDriver(NetworkDriver):
                 * available_ram (int) - Total amount of RAM installed in the device (Not Supported)
                 * used_ram (int) - RAM in use in the device
         """
-        fan_details = self._get_fan_info(**self.session_info)
+        # All the helpers below read the same subsystems payload, fetched by a single GET
+        subsystems = self._get_subsystems_cached()
+        fan_details = self._get_fan_info(subsystems)
         fan_dict = {}
 
         if isinstance(fan_details, dict):
@@ -453,10 +515,9 @@ class AOSCXDriver(NetworkDriver):
                     fan_dict[name] = bool(details)
         else:
             for fan in fan_details:
-                new_dict = {fan['name']: fan['status'] == 'ok'}
-                fan_dict.update(new_dict)
+                fan_dict[fan['name']] = (fan['status'] == 'ok')
 
-        temp_details = self._get_temperature(**self.session_info)
+        temp_details = self._get_temperature(subsystems)
         temp_dict = {}
 
         if isinstance(temp_details, dict):
@@ -468,16 +529,13 @@ class AOSCXDriver(NetworkDriver):
                 }
         else:
             for sensor in temp_details:
-                new_dict = {
-                    sensor['location']: {
-                        'temperature': float(sensor['temperature'] / 1000),
-                        'is_alert':    sensor['status'] == 'critical',
-                        'is_critical': sensor['status'] == 'emergency'
-                    }
+                temp_dict[sensor['location']] = {
+                    'temperature': float(sensor['temperature'] / 1000),
+                    'is_alert':    sensor['status'] == 'critical',
+                    'is_critical': sensor['status'] == 'emergency'
                 }
-                temp_dict.update(new_dict)
 
-        psu_details = self._get_power_supplies(**self.session_info)
+        psu_details = self._get_power_supplies(subsystems)
         psu_dict = {}
 
         if isinstance(psu_details, dict):
@@ -495,16 +553,13 @@ class AOSCXDriver(NetworkDriver):
                 }
         else:
             for psu in psu_details:
-                new_dict = {
-                    psu['name']: {
-                        'status':   psu['status'] == 'ok',
-                        'capacity': float(psu['characteristics']['maximum_power']),
-                        'output':   'N/A'
-                    }
+                psu_dict[psu['name']] = {
+                    'status':   psu['status'] == 'ok',
+                    'capacity': float(psu['characteristics']['maximum_power']),
+                    'output':   'N/A'
                 }
-                psu_dict.update(new_dict)
 
-        resources_details = self._get_resource_utilization(**self.session_info)
+        resources_details = self._get_resource_utilization(subsystems)
         cpu_dict = {}
         mem_dict = {}
 
@@ -516,12 +571,9 @@ class AOSCXDriver(NetworkDriver):
             }
         else:
             for mm in resources_details:
-                new_dict = {
-                    mm['name']: {
-                        '%usage': mm['resource_utilization']['cpu']
-                    }
+                cpu_dict[mm['name']] = {
+                    '%usage': mm['resource_utilization']['cpu']
                 }
-                cpu_dict.update(new_dict)
                 mem_dict = {
                     'available_ram': 'N/A',
                     'used_ram':      mm['resource_utilization']['memory']
@@ -550,44 +602,36 @@ class AOSCXDriver(NetworkDriver):
             * prefix_length (int)
         """
         interface_ip_dictionary = {}
-        interface_list = Interface.get_facts(self.session)
+        interface_list = self._cached_interface_facts()
         for name, details in interface_list.items():
-            interface_ip_list = {}
-            interface_info = Interface(self.session, name)
-            interface_info.get()
-            
-            ip4_address = {}
-            if (('ip4_address' in details) and (details['ip4_address'] is not None) and (len(details['ip4_address']) > 0)):
-                ip4_address = {
-                    details['ip4_address'][:details['ip4_address'].rfind('/')]: {
-                        'prefix_length': int(details['ip4_address'][details['ip4_address'].rfind('/') + 1:])
-                    }
-                }
-            
+            ip, sep, prefix_length = (details.get('ip4_address') or '').rpartition('/')
+            ip4_address = {ip: {'prefix_length': int(prefix_length)}} if sep else {}
+
             ip6_address = {}
             ip6_keys = ['ip6_address_link_local']
             for key in ip6_keys:
-                if (key in details and len(details[key]) > 0):
-                    addresses = list(details[key].keys())
-                    for address in addresses:
-                        ip6_address[address[:address.rfind('/')]] = {
-                            'prefix_length': int(address[address.rfind('/') + 1:])
-                        }
+                for address in details.get(key) or {}:
+                    ip, _, prefix_length = address.rpartition('/')
+                    ip6_address[ip] = {'prefix_length': int(prefix_length)}
                         
-            if hasattr(interface_info, 'ip6_addresses') and len(interface_info.ip6_addresses) > 0:
-                    for ip6_address_obj in interface_info.ip6_addresses:
-                        address = ip6_address_obj.address
-                        ip6_address[address[:address.rfind('/')]] = {
-                            'prefix_length': int(address[address.rfind('/') + 1:])
-                        }
-                                    
-            if (len(ip4_address) > 0):
-                interface_ip_list['ipv4'] = ip4_address
-
-            if (len(ip6_address) > 0):
-                interface_ip_list['ipv6'] = ip6_address
-
-            if (len(interface_ip_list) > 0):
+            # Use the global IPv6 addresses from the bulk facts when present, only
+            # falling back to a per-interface GET when they were not returned and the
+            # interface is routed with IPv6 enabled (a link-local address is assigned).
+            if 'ip6_addresses' in details:
+                ip6_addresses = [unquote(address) for address in (details['ip6_addresses'] or {})]
+            elif details.get('routing', True) and details.get('ip6_address_link_local'):
+                ip6_addresses = self._get_interface_ip6_addresses(name)
+            else:
+                ip6_addresses = []
+            for address in ip6_addresses:
+                ip, _, prefix_length = address.rpartition('/')
+                ip6_address[ip] = {'prefix_length': int(prefix_length)}
+
+            interface_ip_list = {
+                family: addresses for family, addresses in (('ipv4', ip4_address), ('ipv6', ip6_address))
+                if addresses
+            }
+            if interface_ip_list:
                 interface_ip_dictionary[name] = interface_ip_list
 
         return interface_ip_dictionary
@@ -608,15 +652,19 @@ class AOSCXDriver(NetworkDriver):
             * moves (int)
             * last_move (float)
         """
+        mac_entries = self._get_mac_table_bulk()
+        if mac_entries is not None:
+            return mac_entries
+
         mac_list = []
         vlan_list = Vlan.get_all(self.session)
         
-        for vlan in vlan_list:
-            mac_list.append(Mac.get_all(self.session, vlan_list[vlan]))
-        mac_list = list(filter(lambda mac_entry: (len(mac_entry) > 0), mac_list))
+        for vlan in vlan_list.values():
+            mac_list.append(Mac.get_all(self.session, vlan))
+        mac_list = [mac_entry for mac_entry in mac_list if mac_entry]
         mac_entries = []
         for mac in mac_list:
-            mac_key = list(mac.keys())[0]
+            mac_key = next(iter(mac))
             mac_attributes = mac_key.split(',')
             mac_type = mac_attributes[0]
             mac_address = mac_attributes[1]
@@ -624,7 +672,7 @@ class AOSCXDriver(NetworkDriver):
             mac_obj = mac[mac_key]
             mac_obj.get()
             vlan = int(mac_obj._parent_vlan.__dict__['id'])
-            interface = list(mac_obj.__dict__['_original_attributes']['port'].keys())[0]
+            interface = unquote(next(iter(mac_obj._original_attributes['port'])))
             
             
             mac_entries.append(
@@ -699,35 +747,41 @@ class AOSCXDriver(NetworkDriver):
                 "Please select from 'running', 'candidate', 'startup', or 'all'."
             )
 
-        running_config = ""
-        startup_config = ""
-        candidate_config = ""
-
-        headers = {"Accept": "text/plain"}
+        configs = {
+            "running": "",
+            "startup": "",
+            "candidate": "",
+        }
 
-        if retrieve in ("running", "all"):
-            url = f"{self.base_url}configs/running-config"
-            resp = self.session.s.get(url, headers=headers, verify=self.verify_ssl)
-            if not resp.ok:
-                raise MergeConfigException(
-                    f"Running-config fetch failed: {resp.status_code} {resp.text}"
+        # Running and startup configs are independent, so fetch them in parallel. A config
+        # downloaded less than 'facts_cache_ttl' seconds ago is reused.
+        targets = [name for name in ("running", "startup") if retrieve in (name, "all")]
+        if targets:
+            with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+                fetched = executor.map(
+                    lambda name: self._cached_get_facts(('config', name), lambda: self._get_config_text(name)),
+                    targets
                 )
-            running_config = resp.text
+                for name, config in zip(targets, fetched):
+                    configs[name] = config
+
+        return configs
 
-        if retrieve in ("startup", "all"):
-            url = f"{self.base_url}configs/startup-config"
-            resp = self.session.s.get(url, headers=headers, verify=self.verify_ssl)
+    def _get_config_text(self, name):
+        """
+        Perform a streamed, compressed GET call to download a configuration of the switch.
+
+        :param name: Name of the configuration, "running" or "startup"
+        :return: Configuration as plain text
+        """
+        url = f"{self.base_url}configs/{name}-config"
+        headers = {"Accept": "text/plain", "Accept-Encoding": "gzip, deflate"}
+        with self.session.s.get(url, headers=headers, stream=True, verify=self.verify_ssl) as resp:
             if not resp.ok:
                 raise MergeConfigException(
-                    f"Startup-config fetch failed: {resp.status_code} {resp.text}"
+                    f"{name.capitalize()}-config fetch failed: {resp.status_code} {resp.text}"
                 )
-            startup_config = resp.text
-
-        return {
-            "running": running_config,
-            "startup": startup_config,
-            "candidate": candidate_config,
-        }
+            return b"".join(resp.iter_content(65536)).decode(resp.encoding or "utf-8")
 
     # def ping(self, destination, source=c.PING_SOURCE, ttl=c.PING_TTL, timeout=c.PING_TIMEOUT, size=c.PING_SIZE,
     #          count=c.PING_COUNT, vrf=c.PING_VRF):
@@ -853,114 +907,204 @@ class AOSCXDriver(NetworkDriver):
 
     #     return ping_dict
 
-    def _get_fan_info(self, params={}, **kwargs):
+    def _cached_get_facts(self, kind, fn):
         """
-        Perform a GET call to get the fan information of the switch
-        Note that this works for physical devices, not an OVA.
+        Return the result of fn(), reusing the previous result of the same kind if it is
+        younger than 'facts_cache_ttl' seconds.
 
-        :param params: Dictionary of optional parameters for the GET request
-        :param kwargs:
-            keyword s: requests.session object with loaded cookie jar
-            keyword url: URL in main() function
-        :return: Dictionary containing fan information
+        :param kind: Hashable identifying the cached facts, e.g. 'iface' or 'vlan'
+        :param fn: Callable performing the fetch when the facts are missing or expired. It may
+            return None when the fetch failed, in which case nothing is cached.
+        :return: Cached or freshly fetched facts, or None if the fetch failed
         """
-        
-        switch = Device(self.session)
-        switch.get()
-        switch.get_subsystems()
-        
-        keys = ['management_module,1/1', 'chassis,1']
-        for key in keys:
-            if (len(switch.subsystems[key]['fans']) > 0):
-                fan_info_dict = switch.subsystems[key]['fans']
-                break
+        facts = self._fresh_facts(kind)
+        if facts is None:
+            facts = fn()
+            if facts is not None:
+                self._facts_cache[(kind, id(self.session))] = (time.monotonic(), facts)
+        return facts
+
+    def _fresh_facts(self, kind):
+        """
+        Return the cached facts of the given kind if they are younger than 'facts_cache_ttl'
+        seconds, without fetching anything.
 
-        return fan_info_dict
+        :param kind: Hashable identifying the cached facts, e.g. 'iface' or 'vlan'
+        :return: Cached facts, or None if they are missing or expired
+        """
+        cached = self._facts_cache.get((kind, id(self.session)))
+        if cached is not None and time.monotonic() - cached[0] < self.facts_cache_ttl:
+            return cached[1]
+        return None
 
-    def _get_temperature(self, params={}, **kwargs):
+    def _cached_interface_facts(self):
         """
-        Perform a GET call to get the temperature information of the switch
-        Note that this works for physical devices, not an OVA.
+        Return the result of Interface.get_facts() through the facts cache.
+        :return: Dictionary of interface facts keyed by interface name
+        """
+        return self._cached_get_facts('iface', lambda: Interface.get_facts(self.session))
 
-        :param params: Dictionary of optional parameters for the GET request
-        :param kwargs:
-            keyword s: requests.session object with loaded cookie jar
-            keyword url: Base REST API URL (example https://10.0.0.1/rest/v10.09/)
-        :return: List of dict {
-                    'location': str,
-                    'temperature': int,
-                    'status': str         # e.g. 'normal', 'critical', 'emergency'
-                }
+    def _get_interface_vlans(self):
         """
+        Perform a GET call to get only the VLAN membership of every interface of the switch,
+        a much smaller payload than the full interface facts.
 
-        target_url = kwargs["url"] + "system/subsystems"
-        query = {"attributes": "temp_sensors", "depth": 2}
-        response = kwargs["s"].get(target_url, params=query, verify=False)
+        :return: Dictionary keyed by interface name with the 'applied_vlan_tag' and
+            'applied_vlan_trunks' attributes of each interface
+        """
+        target_url = f"{self.base_url}system/interfaces"
+        query = {"attributes": "name,applied_vlan_tag,applied_vlan_trunks", "depth": 1}
+        response = self.session.s.get(target_url, params=query, verify=self.verify_ssl)
+        if not response.ok:
+            raise CommandErrorException(
+                f"Interface VLANs fetch failed: {response.status_code} {response.text}"
+            )
+        return _json_loads(response.content)
 
+    def _get_interface_ip6_addresses(self, name):
+        """
+        Perform a GET call to get the global IPv6 addresses of an interface. Results are kept
+        for 'facts_cache_ttl' seconds so that repeated polls do not fetch every interface again.
+
+        :param name: Name of the interface
+        :return: Tuple of IPv6 addresses in 'address/prefix_length' format
+        """
+        def fetch():
+            interface_info = Interface(self.session, name)
+            interface_info.get()
+            return tuple(ip6_address_obj.address for ip6_address_obj in
+                         getattr(interface_info, 'ip6_addresses', None) or [])
+
+        return self._cached_get_facts(('ip6_addresses', name), fetch)
+
+    def _get_mac_table_bulk(self):
+        """
+        Perform a single GET call to retrieve the MAC entries of every VLAN of the switch.
+
+        :return: List of MAC address table entries in the format of get_mac_address_table, or
+            None if the switch does not support the wildcard MAC endpoint
+        """
+        target_url = (f"{self.base_url}system/vlans/*/macs"
+                      "?depth=2&attributes=port,mac_addr,from")
+        response = self.session.s.get(target_url, verify=self.verify_ssl)
+        if response.status_code == 404:
+            logging.info("Bulk MAC endpoint not available, fetching MAC entries per VLAN")
+            return None
         if not response.ok:
-            logging.warning(
-                "FAIL: Getting temperature sensors failed with status code %d: %s",
-                response.status_code, response.text
+            raise CommandErrorException(
+                f"MAC address table fetch failed: {response.status_code} {response.text}"
             )
-            return []
 
-        data = response.json()
-        subsystems = data.get("subsystems", [])
-        temp_info_list = []
-        for subsystem in subsystems:
-            sensors = subsystem.get("temp_sensors") or []
-            if isinstance(sensors, list):
-                temp_info_list.extend(sensors)
+        mac_entries = []
+        for vlan_id, vlan_macs in _json_loads(response.content).items():
+            for mac_key, mac_details in (vlan_macs or {}).items():
+                mac_type, _, mac_address = mac_key.partition(',')
+                port = mac_details.get('port') or {}
+                mac_entries.append(
+                    {
+                        'mac': mac_details.get('mac_addr', mac_address),
+                        'interface': unquote(next(iter(port))) if port else '',
+                        'vlan': int(vlan_id),
+                        'static': (mac_details.get('from', mac_type) == 'static'),
+                        'active': True,
+                        'moves': None,
+                        'last_move': None
+                    }
+                )
+        return mac_entries
+
+    def _get_subsystems_cached(self):
+        """
+        Perform a single GET call to get the fans, power supplies, temperature sensors and
+        resource utilization of every subsystem of the switch, reusing the previous result
+        if it is younger than 'facts_cache_ttl' seconds.
+
+        :return: Dictionary of subsystems keyed by '<type>,<name>', e.g. 'chassis,1', empty
+            if the GET call failed
+        """
+        def fetch():
+            target_url = f"{self.base_url}system/subsystems"
+            query = {"attributes": "fans,power_supplies,temp_sensors,resource_utilization", "depth": 2}
+            response = self.session.s.get(target_url, params=query, verify=self.verify_ssl)
+            if not response.ok:
+                logging.warning(
+                    "FAIL: Getting subsystems failed with status code %d: %s",
+                    response.status_code, response.text
+                )
+                # Not cached, so the next call retries the GET
+                return None
+            return _json_loads(response.content)
+
+        return self._cached_get_facts('subsystems', fetch) or {}
+
+    def _first_nonempty(self, subsystems, attr, keys=('management_module,1/1', 'chassis,1')):
+        """
+        Return the first non-empty value of a subsystem attribute, looking at the subsystems
+        in the given order.
 
-        return temp_info_list
+        :param subsystems: Dictionary of subsystems keyed by '<type>,<name>'
+        :param attr: Name of the subsystem attribute, e.g. 'fans'
+        :param keys: Subsystem keys to look at, in order of preference
+        :return: Value of the attribute, or an empty dictionary if no subsystem has it
+        """
+        return next((subsystems[key][attr] for key in keys if subsystems.get(key, {}).get(attr)), {})
 
-    def _get_power_supplies(self, params={}, **kwargs):
+    def _get_fan_info(self, subsystems):
         """
-        Perform a GET call to get the power supply information of the switch
+        Get the fan information of the switch from the given subsystems,
+        no additional GET call is made.
         Note that this works for physical devices, not an OVA.
 
-        :param params: Dictionary of optional parameters for the GET request
-        :param kwargs:
-            keyword s: requests.session object with loaded cookie jar
-            keyword url: URL in main() function
-        :return: Dictionary containing power supply information
+        :param subsystems: Dictionary of subsystems returned by _get_subsystems_cached()
+
+        :return: Dictionary containing fan information
         """
-        
-        switch = Device(self.session)
-        switch.get()
-        switch.get_subsystems()
-        
-        keys = ['management_module,1/1', 'chassis,1']
-        for key in keys:
-            if (len(switch.subsystems[key]['power_supplies']) > 0):
-                power_supply_dict = switch.subsystems[key]['power_supplies']
-                break
+        return self._first_nonempty(subsystems, 'fans')
 
-        return power_supply_dict
+    def _get_temperature(self, subsystems):
+        """
+        Get the temperature information of the switch from the given subsystems,
+        no additional GET call is made.
+        Note that this works for physical devices, not an OVA.
 
-    def _get_resource_utilization(self, params={}, **kwargs):
+        :param subsystems: Dictionary of subsystems returned by _get_subsystems_cached()
+
+        :return: List of dict {
+                    'location': str,
+                    'temperature': int,
+                    'status': str         # e.g. 'normal', 'critical', 'emergency'
+                }
+        """
+        sensor_groups = filter(None, map(methodcaller("get", "temp_sensors"),
+                                         subsystems.values()))
+        # Sensors are keyed by name when expanded, keep only their details
+        return list(chain.from_iterable(
+            sensors.values() if isinstance(sensors, dict) else sensors for sensors in sensor_groups
+        ))
+
+    def _get_power_supplies(self, subsystems):
         """
-        Perform a GET call to get the cpu, memory, and open_fds of the switch
+        Get the power supply information of the switch from the given subsystems,
+        no additional GET call is made.
         Note that this works for physical devices, not an OVA.
 
-        :param params: Dictionary of optional parameters for the GET request
-        :param kwargs:
-            keyword s: requests.session object with loaded cookie jar
-            keyword url: URL in main() function
+        :param subsystems: Dictionary of subsystems returned by _get_subsystems_cached()
+
+        :return: Dictionary containing power supply information
+        """
+        return self._first_nonempty(subsystems, 'power_supplies')
+
+    def _get_resource_utilization(self, subsystems):
+        """
+        Get the cpu, memory, and open_fds of the switch from the given subsystems,
+        no additional GET call is made.
+        Note that this works for physical devices, not an OVA.
+
+        :param subsystems: Dictionary of subsystems returned by _get_subsystems_cached()
+
         :return: Dictionary containing resource utilization information
         """
-        
-        switch = Device(self.session)
-        switch.get()
-        switch.get_subsystems()
-        
-        keys = ['management_module,1/1', 'chassis,1']
-        for key in keys:
-            if (len(switch.subsystems[key]['resource_utilization']) > 0):
-                resources_dict = switch.subsystems[key]['resource_utilization']
-                break
-            
-        return resources_dict
+        return self._first_nonempty(subsystems, 'resource_utilization')
 
     # def _get_ntp_associations(self, params={}, **kwargs):
     #     """
@@ -1004,29 +1148,34 @@ class AOSCXDriver(NetworkDriver):
              * interfaces (list)
             """
             
-            vlan_json = {}
-            vlan_list = Vlan.get_facts(self.session)
-            
-            for vlan_id in vlan_list:
-                vlan_json[int(vlan_id)] = {
-                    "name": vlan_list[vlan_id]['name'],
-                    "interfaces": []
+            # The VLAN facts and the interface VLAN membership are independent, so the VLAN
+            # facts are fetched in a worker while the interfaces are fetched here.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                vlan_future = executor.submit(
+                    self._cached_get_facts, 'vlan', lambda: Vlan.get_facts(self.session)
+                )
+                # Reuse the full interface facts if another getter just fetched them,
+                # otherwise only download the VLAN membership of the interfaces.
+                interface_list = self._fresh_facts('iface')
+                if interface_list is None:
+                    interface_list = self._cached_get_facts('iface_vlans', self._get_interface_vlans)
+                vlan_list = vlan_future.result()
+
+            # Single pass over the physical interfaces, grouping them by VLAN id. The ids are
+            # kept as the strings returned by the switch, the same keys as in vlan_list, so
+            # that each id is converted to int only once below.
+            vlan_interfaces = defaultdict(list)
+            for interface, interface_facts in interface_list.items():
+                if not _PHYS_RE.match(interface):
+                    continue
+                vlan_ids = interface_facts.get('applied_vlan_trunks') or interface_facts.get('applied_vlan_tag') or ()
+                for vlan_id in vlan_ids:
+                    vlan_interfaces[vlan_id].append(interface)
+
+            return {
+                int(vlan_id): {
+                    "name": vlan_facts['name'],
+                    "interfaces": vlan_interfaces.get(vlan_id, [])
                 }
-                
-            interface_list = Interface.get_facts(self.session)
-            physical_interface_list = {key: value for key, value in interface_list.items() if '/' in key}
-            
-            for interface in physical_interface_list:
-                interface_facts = interface_list[interface]
-                vlan_ids = []
-                key = ""
-                if 'applied_vlan_trunks' in interface_facts and interface_facts['applied_vlan_trunks'] and (len(interface_facts['applied_vlan_trunks']) > 0):
-                    key = 'applied_vlan_trunks'
-                elif 'applied_vlan_tag' in interface_facts and interface_facts['applied_vlan_tag'] and (len(interface_facts['applied_vlan_tag']) > 0):
-                    key = 'applied_vlan_tag'
-                if key != "":
-                    vlan_ids = [int(key) for key in interface_facts[key]]
-                    for id in vlan_ids:
-                        vlan_json[id]['interfaces'].append(interface)
-                        
-            return vlan_json
+                for vlan_id, vlan_facts in vlan_list.items()
+            }